@@ -4,35 +4,120 @@ Universal Wardriving File Converter
 Supports: DStumbler, G-Mon, inSSIDer, Kismac, Kismet, MacStumbler, NetStumbler,
           Pocket Warrior, Wardrive-Android, WiFiFoFum, WiFi-Where, WiGLE
 Converts ANY wardriving format to standardized CSV
+
+Library use (nothing is written or printed):
+    for record in iter_records('survey.netxml'): ...
+    for batch in iter_batches('wigle.csv', 65536, kind='numpy'): ...
+    convert_many(paths, 'out', executor=ProcessPoolExecutor())
 """
 
-import xml.etree.ElementTree as ET
-import csv
 import sys
 import os
-import json
-import re
-import zipfile
-from pathlib import Path
-from datetime import datetime
+import time
+import math
+from itertools import chain, groupby
+
+
+class LazyModule:
+    """Stand-in for a module that is only imported on first attribute access
+
+    Keeps CLI startup cheap: a conversion only pays for the parsers and
+    writers it actually uses. On first use the real module replaces the
+    stand-in in this module's globals, so hot loops pay no proxy overhead.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            __import__(self._name)
+            self._module = sys.modules[self._name]
+            globals()[self._alias] = self._module
+        # Cache on the instance for anything still holding the stand-in
+        value = getattr(self._module, attr)
+        setattr(self, attr, value)
+        return value
+
+
+ET = LazyModule('xml.etree.ElementTree', 'ET')
+csv = LazyModule('csv', 'csv')
+json = LazyModule('json', 'json')
+re = LazyModule('re', 're')
+gzip = LazyModule('gzip', 'gzip')
+sqlite3 = LazyModule('sqlite3', 'sqlite3')
+zipfile = LazyModule('zipfile', 'zipfile')
+saxutils = LazyModule('xml.sax.saxutils', 'saxutils')
 
 # KML namespace
 KML_NS = {'kml': 'http://www.opengis.net/kml/2.2'}
 
+# Standard output field order
+STANDARD_FIELDS = ['ssid', 'bssid', 'latitude', 'longitude', 'altitude',
+                   'signal', 'channel', 'encryption', 'type', 'timestamp']
+
+# Parser method for each detected format (anything else uses the generic parser)
+PARSERS = {
+    'kml': 'parse_kml',
+    'kmz': 'parse_kmz',
+    'wigle_csv': 'parse_wigle_csv',
+    'kismet_csv': 'parse_kismet_csv',
+    'kismet_netxml': 'parse_kismet_netxml',
+    'generic_text': 'parse_generic_text',
+    'generic_gps_text': 'parse_generic_text',
+}
+
+# Input file extensions picked up in folder mode
+SUPPORTED_EXTENSIONS = ['.kml', '.kmz', '.csv', '.xml', '.netxml', '.gpsxml', '.txt', '.ns1', '.nss']
+
+# Formats that can be tailed while the capture tool is still writing them
+FOLLOW_CSV_FORMATS = ['wigle_csv', 'kismet_csv']
+FOLLOW_TEXT_FORMATS = ['generic_csv', 'generic_text', 'generic_gps_text']
+FOLLOW_XML_TAGS = {
+    'kismet_netxml': 'wireless-network',
+    'kml': '{%s}Placemark' % KML_NS['kml'],
+}
+
+# Formats written as whole-document snapshots, so a rewrite repeats earlier
+# records: Kismet netxml (one entry per network, keyed by BSSID) and KML
+# (keyed by placemark content, since one file can hold several per BSSID)
+FOLLOW_SNAPSHOT_FORMATS = ['kismet_netxml', 'kml']
+
+# Output format chosen from the output file extension
+OUTPUT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.geojson': 'geojson',
+    '.json': 'geojson',
+    '.geojsonl': 'geojsonl',
+    '.geojsons': 'geojsonl',
+    '.ndjson': 'geojsonl',
+    '.kml': 'kml',
+    '.mbtiles': 'mbtiles',
+}
+
 
 class WardriveConverter:
     """Universal converter for all wardriving file formats"""
 
-    def __init__(self):
+    def __init__(self, verbose=True):
         self.results = []
+        self.record_count = 0
         self.file_type = None
+        self.verbose = verbose
+
+    def log(self, *args, **kwargs):
+        """Print progress output unless the converter is quiet"""
+        if self.verbose:
+            print(*args, **kwargs)
 
     def detect_format(self, filepath):
         """Detect the wardriving file format"""
         ext = filepath.lower().split('.')[-1]
 
-        print(f"[*] Detecting file format for: {filepath}")
-        print(f"[*] File extension: .{ext}")
+        self.log(f"[*] Detecting file format for: {filepath}")
+        self.log(f"[*] File extension: .{ext}")
 
         # Read first few lines/bytes to determine format
         try:
@@ -99,96 +184,101 @@ class WardriveConverter:
             if 'wiscan' in header_text.lower() or ext == 'wsc':
                 return 'wiscan'
 
-            print(f"[!] Unknown format, attempting generic parser")
+            self.log(f"[!] Unknown format, attempting generic parser")
             return 'generic_text'
 
         except Exception as e:
-            print(f"[!] Error detecting format: {e}")
+            self.log(f"[!] Error detecting format: {e}")
             return 'unknown'
 
     def parse_kml(self, filepath):
         """Parse KML format"""
-        print(f"[*] Parsing as KML format")
+        self.log(f"[*] Parsing as KML format")
         try:
             tree = ET.parse(filepath)
             root = tree.getroot()
         except ET.ParseError as e:
-            print(f"[!] ERROR: Failed to parse XML - {e}")
+            self.log(f"[!] ERROR: Failed to parse XML - {e}")
             return []
 
         placemarks = root.findall('.//kml:Placemark', KML_NS)
-        print(f"[*] Found {len(placemarks)} placemarks")
+        self.log(f"[*] Found {len(placemarks)} placemarks")
 
         results = []
         for placemark in placemarks:
-            data = {}
-
-            # Name (SSID or identifier)
-            name = placemark.find('.//kml:name', KML_NS)
-            if name is not None and name.text:
-                data['ssid'] = name.text.strip()
-
-            # Description (contains detailed info)
-            desc = placemark.find('.//kml:description', KML_NS)
-            if desc is not None and desc.text:
-                desc_text = desc.text.strip()
-                # Parse description fields
-                for line in desc_text.split('\n'):
-                    if ':' in line:
-                        parts = line.split(':', 1)
-                        if len(parts) == 2:
-                            key = parts[0].strip().lower()
-                            value = parts[1].strip()
-
-                            if key == 'ssid':
-                                data['ssid'] = value
-                            elif key in ['bssid', 'mac', 'mac address']:
-                                data['bssid'] = value
-                            elif 'signal' in key or 'rssi' in key:
-                                data['signal'] = value
-                            elif key == 'channel':
-                                data['channel'] = value
-                            elif 'encrypt' in key or 'security' in key:
-                                data['encryption'] = value
-                            elif 'type' in key:
-                                data['type'] = value
-                            elif 'time' in key:
-                                data['timestamp'] = value
-
-            # Coordinates
-            coord = placemark.find('.//kml:coordinates', KML_NS)
-            if coord is not None and coord.text:
-                coords = coord.text.strip().split(',')
-                if len(coords) >= 2:
-                    data['longitude'] = coords[0].strip()
-                    data['latitude'] = coords[1].strip()
-                    if len(coords) >= 3:
-                        data['altitude'] = coords[2].strip()
-
-            # Extended data
-            extended = placemark.find('.//kml:ExtendedData', KML_NS)
-            if extended is not None:
-                for data_elem in extended.findall('.//kml:Data', KML_NS):
-                    name_attr = data_elem.get('name')
-                    value_elem = data_elem.find('.//kml:value', KML_NS)
-                    if name_attr and value_elem is not None and value_elem.text:
-                        key = name_attr.lower().replace(' ', '_')
-                        data[key] = value_elem.text.strip()
-
+            data = self._parse_placemark(placemark)
             if data:
                 results.append(data)
 
         return results
 
+    def _parse_placemark(self, placemark):
+        """Extract one record from a KML Placemark element"""
+        data = {}
+
+        # Name (SSID or identifier)
+        name = placemark.find('.//kml:name', KML_NS)
+        if name is not None and name.text:
+            data['ssid'] = name.text.strip()
+
+        # Description (contains detailed info)
+        desc = placemark.find('.//kml:description', KML_NS)
+        if desc is not None and desc.text:
+            desc_text = desc.text.strip()
+            # Parse description fields
+            for line in desc_text.split('\n'):
+                if ':' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) == 2:
+                        key = parts[0].strip().lower()
+                        value = parts[1].strip()
+
+                        if key == 'ssid':
+                            data['ssid'] = value
+                        elif key in ['bssid', 'mac', 'mac address']:
+                            data['bssid'] = value
+                        elif 'signal' in key or 'rssi' in key:
+                            data['signal'] = value
+                        elif key == 'channel':
+                            data['channel'] = value
+                        elif 'encrypt' in key or 'security' in key:
+                            data['encryption'] = value
+                        elif 'type' in key:
+                            data['type'] = value
+                        elif 'time' in key:
+                            data['timestamp'] = value
+
+        # Coordinates
+        coord = placemark.find('.//kml:coordinates', KML_NS)
+        if coord is not None and coord.text:
+            coords = coord.text.strip().split(',')
+            if len(coords) >= 2:
+                data['longitude'] = coords[0].strip()
+                data['latitude'] = coords[1].strip()
+                if len(coords) >= 3:
+                    data['altitude'] = coords[2].strip()
+
+        # Extended data
+        extended = placemark.find('.//kml:ExtendedData', KML_NS)
+        if extended is not None:
+            for data_elem in extended.findall('.//kml:Data', KML_NS):
+                name_attr = data_elem.get('name')
+                value_elem = data_elem.find('.//kml:value', KML_NS)
+                if name_attr and value_elem is not None and value_elem.text:
+                    key = name_attr.lower().replace(' ', '_')
+                    data[key] = value_elem.text.strip()
+
+        return data
+
     def parse_kmz(self, filepath):
         """Parse KMZ (zipped KML) format"""
-        print(f"[*] Parsing as KMZ format (extracting...)")
+        self.log(f"[*] Parsing as KMZ format (extracting...)")
         try:
             with zipfile.ZipFile(filepath, 'r') as kmz:
                 kml_files = [f for f in kmz.namelist() if f.endswith('.kml')]
 
                 if not kml_files:
-                    print("[!] No KML file found in KMZ")
+                    self.log("[!] No KML file found in KMZ")
                     return []
 
                 kml_file = kml_files[0]
@@ -202,12 +292,12 @@ class WardriveConverter:
 
                 return results
         except Exception as e:
-            print(f"[!] Error parsing KMZ: {e}")
+            self.log(f"[!] Error parsing KMZ: {e}")
             return []
 
     def parse_wigle_csv(self, filepath):
         """Parse WiGLE WiFi CSV format"""
-        print(f"[*] Parsing as WiGLE CSV format")
+        self.log(f"[*] Parsing as WiGLE CSV format")
         results = []
 
         try:
@@ -226,44 +316,49 @@ class WardriveConverter:
                 reader = csv.DictReader(lines[header_idx:])
 
                 for row in reader:
-                    data = {}
-
-                    # WiGLE CSV fields (map to standard format)
-                    if 'MAC' in row:
-                        data['bssid'] = row['MAC']
-                    if 'SSID' in row:
-                        data['ssid'] = row['SSID']
-                    if 'CurrentLatitude' in row:
-                        data['latitude'] = row['CurrentLatitude']
-                    if 'CurrentLongitude' in row:
-                        data['longitude'] = row['CurrentLongitude']
-                    if 'AltitudeMeters' in row:
-                        data['altitude'] = row['AltitudeMeters']
-                    if 'RSSI' in row:
-                        data['signal'] = row['RSSI']
-                    if 'Channel' in row:
-                        data['channel'] = row['Channel']
-                    if 'AuthMode' in row:
-                        data['encryption'] = row['AuthMode']
-                    if 'Type' in row:
-                        data['type'] = row['Type']
-                    if 'FirstSeen' in row:
-                        data['first_seen'] = row['FirstSeen']
-                    if 'LastSeen' in row:
-                        data['last_seen'] = row['LastSeen']
-
+                    data = self._map_wigle_row(row)
                     results.append(data)
 
-            print(f"[*] Parsed {len(results)} WiGLE records")
+            self.log(f"[*] Parsed {len(results)} WiGLE records")
             return results
 
         except Exception as e:
-            print(f"[!] Error parsing WiGLE CSV: {e}")
+            self.log(f"[!] Error parsing WiGLE CSV: {e}")
             return []
 
+    def _map_wigle_row(self, row):
+        """Map one WiGLE CSV row to standard field names"""
+        data = {}
+
+        # WiGLE CSV fields (map to standard format)
+        if 'MAC' in row:
+            data['bssid'] = row['MAC']
+        if 'SSID' in row:
+            data['ssid'] = row['SSID']
+        if 'CurrentLatitude' in row:
+            data['latitude'] = row['CurrentLatitude']
+        if 'CurrentLongitude' in row:
+            data['longitude'] = row['CurrentLongitude']
+        if 'AltitudeMeters' in row:
+            data['altitude'] = row['AltitudeMeters']
+        if 'RSSI' in row:
+            data['signal'] = row['RSSI']
+        if 'Channel' in row:
+            data['channel'] = row['Channel']
+        if 'AuthMode' in row:
+            data['encryption'] = row['AuthMode']
+        if 'Type' in row:
+            data['type'] = row['Type']
+        if 'FirstSeen' in row:
+            data['first_seen'] = row['FirstSeen']
+        if 'LastSeen' in row:
+            data['last_seen'] = row['LastSeen']
+
+        return data
+
     def parse_kismet_csv(self, filepath):
         """Parse Kismet CSV format"""
-        print(f"[*] Parsing as Kismet CSV format")
+        self.log(f"[*] Parsing as Kismet CSV format")
         results = []
 
         try:
@@ -271,43 +366,51 @@ class WardriveConverter:
                 reader = csv.DictReader(f)
 
                 for row in reader:
-                    data = {}
-
-                    # Kismet CSV field mapping
-                    for key, value in row.items():
-                        key_lower = key.lower()
-
-                        if 'bssid' in key_lower or 'mac' in key_lower:
-                            data['bssid'] = value
-                        elif 'ssid' in key_lower:
-                            data['ssid'] = value
-                        elif 'lat' in key_lower:
-                            data['latitude'] = value
-                        elif 'lon' in key_lower:
-                            data['longitude'] = value
-                        elif 'channel' in key_lower:
-                            data['channel'] = value
-                        elif 'signal' in key_lower or 'rssi' in key_lower:
-                            data['signal'] = value
-                        elif 'crypt' in key_lower or 'encrypt' in key_lower:
-                            data['encryption'] = value
-                        elif 'type' in key_lower:
-                            data['type'] = value
-                        elif 'time' in key_lower:
-                            data['timestamp'] = value
-
+                    data = self._map_kismet_csv_row(row)
                     results.append(data)
 
-            print(f"[*] Parsed {len(results)} Kismet CSV records")
+            self.log(f"[*] Parsed {len(results)} Kismet CSV records")
             return results
 
         except Exception as e:
-            print(f"[!] Error parsing Kismet CSV: {e}")
+            self.log(f"[!] Error parsing Kismet CSV: {e}")
             return []
 
+    def _map_kismet_csv_row(self, row):
+        """Map one Kismet CSV row to standard field names"""
+        data = {}
+
+        # Kismet CSV field mapping
+        for key, value in row.items():
+            # DictReader files surplus fields of a ragged row under None
+            if key is None:
+                continue
+            key_lower = key.lower()
+
+            if 'bssid' in key_lower or 'mac' in key_lower:
+                data['bssid'] = value
+            elif 'ssid' in key_lower:
+                data['ssid'] = value
+            elif 'lat' in key_lower:
+                data['latitude'] = value
+            elif 'lon' in key_lower:
+                data['longitude'] = value
+            elif 'channel' in key_lower:
+                data['channel'] = value
+            elif 'signal' in key_lower or 'rssi' in key_lower:
+                data['signal'] = value
+            elif 'crypt' in key_lower or 'encrypt' in key_lower:
+                data['encryption'] = value
+            elif 'type' in key_lower:
+                data['type'] = value
+            elif 'time' in key_lower:
+                data['timestamp'] = value
+
+        return data
+
     def parse_kismet_netxml(self, filepath):
         """Parse Kismet .netxml format"""
-        print(f"[*] Parsing as Kismet NetXML format")
+        self.log(f"[*] Parsing as Kismet NetXML format")
         results = []
 
         try:
@@ -315,61 +418,66 @@ class WardriveConverter:
             root = tree.getroot()
 
             networks = root.findall('.//wireless-network')
-            print(f"[*] Found {len(networks)} networks")
+            self.log(f"[*] Found {len(networks)} networks")
 
             for network in networks:
-                data = {}
-
-                # SSID
-                ssid = network.find('.//SSID/essid')
-                if ssid is not None and ssid.text:
-                    data['ssid'] = ssid.text
-
-                # BSSID
-                bssid = network.find('.//BSSID')
-                if bssid is not None and bssid.text:
-                    data['bssid'] = bssid.text
-
-                # Channel
-                channel = network.find('.//channel')
-                if channel is not None and channel.text:
-                    data['channel'] = channel.text
-
-                # Encryption
-                encryption = network.find('.//encryption')
-                if encryption is not None and encryption.text:
-                    data['encryption'] = encryption.text
-
-                # GPS coordinates
-                gps_info = network.find('.//gps-info')
-                if gps_info is not None:
-                    lat = gps_info.find('.//avg-lat')
-                    lon = gps_info.find('.//avg-lon')
-                    alt = gps_info.find('.//avg-alt')
-
-                    if lat is not None and lat.text:
-                        data['latitude'] = lat.text
-                    if lon is not None and lon.text:
-                        data['longitude'] = lon.text
-                    if alt is not None and alt.text:
-                        data['altitude'] = alt.text
-
-                # Signal strength
-                signal = network.find('.//max-signal-dbm')
-                if signal is not None and signal.text:
-                    data['signal'] = signal.text
-
+                data = self._parse_netxml_network(network)
                 results.append(data)
 
             return results
 
         except Exception as e:
-            print(f"[!] Error parsing Kismet NetXML: {e}")
+            self.log(f"[!] Error parsing Kismet NetXML: {e}")
             return []
 
+    def _parse_netxml_network(self, network):
+        """Extract one record from a Kismet wireless-network element"""
+        data = {}
+
+        # SSID
+        ssid = network.find('.//SSID/essid')
+        if ssid is not None and ssid.text:
+            data['ssid'] = ssid.text
+
+        # BSSID
+        bssid = network.find('.//BSSID')
+        if bssid is not None and bssid.text:
+            data['bssid'] = bssid.text
+
+        # Channel
+        channel = network.find('.//channel')
+        if channel is not None and channel.text:
+            data['channel'] = channel.text
+
+        # Encryption
+        encryption = network.find('.//encryption')
+        if encryption is not None and encryption.text:
+            data['encryption'] = encryption.text
+
+        # GPS coordinates
+        gps_info = network.find('.//gps-info')
+        if gps_info is not None:
+            lat = gps_info.find('.//avg-lat')
+            lon = gps_info.find('.//avg-lon')
+            alt = gps_info.find('.//avg-alt')
+
+            if lat is not None and lat.text:
+                data['latitude'] = lat.text
+            if lon is not None and lon.text:
+                data['longitude'] = lon.text
+            if alt is not None and alt.text:
+                data['altitude'] = alt.text
+
+        # Signal strength
+        signal = network.find('.//max-signal-dbm')
+        if signal is not None and signal.text:
+            data['signal'] = signal.text
+
+        return data
+
     def parse_generic_text(self, filepath):
         """Parse generic text format (DStumbler, Pocket Warrior, etc.)"""
-        print(f"[*] Parsing as generic text format")
+        self.log(f"[*] Parsing as generic text format")
         results = []
 
         try:
@@ -382,100 +490,151 @@ class WardriveConverter:
                 if not line or line.startswith('#'):
                     continue
 
-                data = {}
-
-                # Try tab-separated
-                if '\t' in line:
-                    parts = line.split('\t')
-                # Try comma-separated (but not CSV with quotes)
-                elif ',' in line and '"' not in line:
-                    parts = line.split(',')
-                # Try space-separated
-                else:
-                    parts = line.split()
-
-                # Try to extract common patterns
-                for part in parts:
-                    part = part.strip()
-
-                    # MAC address pattern
-                    if re.match(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$', part):
-                        data['bssid'] = part
-                    # Coordinate patterns
-                    elif re.match(r'^-?\d+\.\d+$', part):
-                        value = float(part)
-                        if -90 <= value <= 90 and 'latitude' not in data:
-                            data['latitude'] = part
-                        elif -180 <= value <= 180 and 'longitude' not in data:
-                            data['longitude'] = part
-                    # Signal strength pattern
-                    elif re.match(r'^-\d+$', part) and int(part) < 0:
-                        data['signal'] = part
-                    # Channel pattern
-                    elif part.isdigit() and 1 <= int(part) <= 165:
-                        if 'channel' not in data:
-                            data['channel'] = part
-
+                data = self._parse_text_line(line)
                 if data:
                     results.append(data)
 
-            print(f"[*] Parsed {len(results)} text records")
+            self.log(f"[*] Parsed {len(results)} text records")
             return results
 
         except Exception as e:
-            print(f"[!] Error parsing text format: {e}")
+            self.log(f"[!] Error parsing text format: {e}")
             return []
 
+    def _parse_text_line(self, line):
+        """Extract fields from one line of a delimited text log"""
+        data = {}
+
+        # Try tab-separated
+        if '\t' in line:
+            parts = line.split('\t')
+        # Try comma-separated (but not CSV with quotes)
+        elif ',' in line and '"' not in line:
+            parts = line.split(',')
+        # Try space-separated
+        else:
+            parts = line.split()
+
+        # Try to extract common patterns
+        for part in parts:
+            part = part.strip()
+
+            # MAC address pattern
+            if re.match(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$', part):
+                data['bssid'] = part
+            # Coordinate patterns
+            elif re.match(r'^-?\d+\.\d+$', part):
+                value = float(part)
+                if -90 <= value <= 90 and 'latitude' not in data:
+                    data['latitude'] = part
+                elif -180 <= value <= 180 and 'longitude' not in data:
+                    data['longitude'] = part
+            # Signal strength pattern
+            elif re.match(r'^-\d+$', part) and int(part) < 0:
+                data['signal'] = part
+            # Channel pattern
+            elif part.isdigit() and 1 <= int(part) <= 165:
+                if 'channel' not in data:
+                    data['channel'] = part
+
+        return data
+
+    def parse_file(self, filepath, file_format):
+        """Parse a file with the parser registered for its detected format"""
+        parser = PARSERS.get(file_format)
+        if parser is None:
+            self.log(f"[!] Format '{file_format}' not yet implemented, trying generic parser")
+            parser = 'parse_generic_text'
+        return getattr(self, parser)(filepath)
+
+    def find_files(self, folder_path, recursive=False, skip_folder=None):
+        """List supported wardriving files in a folder"""
+        files = []
+        if recursive:
+            for root, dirs, names in os.walk(folder_path):
+                # Skip output folder
+                if skip_folder and root.startswith(skip_folder):
+                    continue
+                for name in names:
+                    if any(name.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+                        files.append(os.path.join(root, name))
+        else:
+            for name in os.listdir(folder_path):
+                filepath = os.path.join(folder_path, name)
+                if os.path.isfile(filepath) and any(name.lower().endswith(ext) for ext in SUPPORTED_EXTENSIONS):
+                    files.append(filepath)
+        return files
+
     def normalize_data(self, data_list):
         """Normalize all data to standard CSV format"""
-        print(f"[*] Normalizing {len(data_list)} records to standard format")
-
-        normalized = []
-        for data in data_list:
-            norm = {}
+        self.log(f"[*] Normalizing {len(data_list)} records to standard format")
+        return [self.normalize_record(data) for data in data_list]
 
-            # Standard fields
-            norm['ssid'] = data.get('ssid', '')
-            norm['bssid'] = data.get('bssid', '')
-            norm['latitude'] = data.get('latitude', '')
-            norm['longitude'] = data.get('longitude', '')
-            norm['altitude'] = data.get('altitude', '')
-            norm['signal'] = data.get('signal', '')
-            norm['channel'] = data.get('channel', '')
-            norm['encryption'] = data.get('encryption', '')
-            norm['type'] = data.get('type', '')
-            norm['timestamp'] = data.get('timestamp', data.get('first_seen', data.get('last_seen', '')))
+    def stream_records(self, filepath, file_format):
+        """Normalized records of a file as an iterator, or None if it has none
 
-            # Add any extra fields
-            for key, value in data.items():
-                if key not in norm:
-                    norm[key] = value
-
-            normalized.append(norm)
+        Records are read in chunks (see iter_records) and counted into
+        record_count as they are consumed, so map writers can be fed without
+        holding the whole file in memory.
+        """
+        records = iter_records(filepath, file_format, self)
+        try:
+            first = next(records)
+        except StopIteration:
+            return None
+        return self._counted(chain([first], records))
+
+    def _counted(self, records):
+        self.record_count = 0
+        for record in records:
+            self.record_count += 1
+            yield record
+
+    def normalize_record(self, data):
+        """Normalize one parsed record to the standard fields"""
+        norm = {}
+
+        # Standard fields
+        norm['ssid'] = data.get('ssid', '')
+        norm['bssid'] = data.get('bssid', '')
+        norm['latitude'] = data.get('latitude', '')
+        norm['longitude'] = data.get('longitude', '')
+        norm['altitude'] = data.get('altitude', '')
+        norm['signal'] = data.get('signal', '')
+        norm['channel'] = data.get('channel', '')
+        norm['encryption'] = data.get('encryption', '')
+        norm['type'] = data.get('type', '')
+        norm['timestamp'] = data.get('timestamp', data.get('first_seen', data.get('last_seen', '')))
+
+        # Add any extra fields
+        for key, value in data.items():
+            if key not in norm:
+                norm[key] = value
+
+        return norm
+
+    def _csv_fieldnames(self, data):
+        """Column order for CSV output: standard fields first, then extras"""
+        # Collect all unique fields
+        all_fields = set()
+        for record in data:
+            all_fields.update(record.keys())
 
-        return normalized
+        # Order: standard fields first, then extras
+        fieldnames = [f for f in STANDARD_FIELDS if f in all_fields]
+        fieldnames += sorted([f for f in all_fields if f not in STANDARD_FIELDS])
+        return fieldnames
 
     def write_csv(self, data, output_file):
         """Write normalized data to CSV"""
         if not data:
-            print("[!] No data to write")
+            self.log("[!] No data to write")
             return False
 
-        # Standard field order
-        standard_fields = ['ssid', 'bssid', 'latitude', 'longitude', 'altitude',
-                          'signal', 'channel', 'encryption', 'type', 'timestamp']
+        fieldnames = self._csv_fieldnames(data)
 
-        # Collect all unique fields
-        all_fields = set()
-        for record in data:
-            all_fields.update(record.keys())
-
-        # Order: standard fields first, then extras
-        fieldnames = [f for f in standard_fields if f in all_fields]
-        fieldnames += sorted([f for f in all_fields if f not in standard_fields])
-
-        print(f"[*] Writing {len(data)} records to: {output_file}")
-        print(f"[*] Columns: {', '.join(fieldnames)}")
+        self.log(f"[*] Writing {len(data)} records to: {output_file}")
+        self.log(f"[*] Columns: {', '.join(fieldnames)}")
 
         try:
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
@@ -486,89 +645,257 @@ class WardriveConverter:
                     writer.writerow(record)
 
                     if i % 1000 == 0:
-                        print(f"[*] Wrote {i}/{len(data)} records...")
+                        self.log(f"[*] Wrote {i}/{len(data)} records...")
 
             size = os.path.getsize(output_file)
             size_mb = size / (1024 * 1024)
-            print(f"[+] SUCCESS! {len(data)} records written")
-            print(f"[+] Output: {output_file} ({size_mb:.2f} MB)")
+            self.log(f"[+] SUCCESS! {len(data)} records written")
+            self.log(f"[+] Output: {output_file} ({size_mb:.2f} MB)")
+            return True
+
+        except Exception as e:
+            self.log(f"[!] Error writing CSV: {e}")
+            return False
+
+    def write_output(self, data, output_file, output_format=None):
+        """Write normalized data as CSV, GeoJSON, KML or MBTiles"""
+        output_format = output_format or output_format_for(output_file)
+        if output_format == 'csv':
+            return self.write_csv(data, output_file)
+
+        if not data:
+            self.log("[!] No data to write")
+            return False
+
+        # data may be a list or a record stream of unknown length
+        total = f"/{len(data)}" if isinstance(data, list) else ""
+        count = f"{len(data)} " if isinstance(data, list) else ""
+        self.log(f"[*] Writing {count}records to: {output_file} ({output_format})")
+
+        try:
+            with open_writer(output_format, output_file, self.verbose) as writer:
+                for i, record in enumerate(data, 1):
+                    writer.write(record)
+
+                    if i % 1000 == 0:
+                        self.log(f"[*] Wrote {i}{total} records...")
+
+        except Exception as e:
+            self.log(f"[!] Error writing {output_format}: {e}")
+            return False
+
+        return self.report_written(writer)
+
+    def report_written(self, writer):
+        """Print the summary for a closed map writer"""
+        if writer.skipped:
+            self.log(f"[*] Skipped {writer.skipped} records without GPS coordinates")
+        if not writer.written:
+            self.log("[!] No records with GPS coordinates to write")
+            return False
+
+        size_mb = os.path.getsize(writer.output_file) / (1024 * 1024)
+        self.log(f"[+] SUCCESS! {writer.written} records written")
+        self.log(f"[+] Output: {writer.output_file} ({size_mb:.2f} MB)")
+        return True
+
+    def append_csv(self, data, output_file, fieldnames, write_header=False):
+        """Append normalized records to an existing CSV using fixed columns"""
+        mode = 'w' if write_header else 'a'
+        try:
+            with open(output_file, mode, newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(data)
             return True
 
         except Exception as e:
-            print(f"[!] Error writing CSV: {e}")
+            self.log(f"[!] Error appending to CSV: {e}")
             return False
 
-    def convert(self, input_file, output_file=None):
+    def convert(self, input_file, output_file=None, output_format=None):
         """Main conversion function"""
         # Auto-generate output filename
         if not output_file:
-            output_file = str(Path(input_file).with_suffix('.csv'))
+            output_file = default_output_file(input_file, output_format)
 
-        print("=" * 70)
-        print("  UNIVERSAL WARDRIVING FILE CONVERTER")
-        print("=" * 70)
-        print()
+        self.log("=" * 70)
+        self.log("  UNIVERSAL WARDRIVING FILE CONVERTER")
+        self.log("=" * 70)
+        self.log()
 
         # Check file exists
         if not os.path.exists(input_file):
-            print(f"[!] ERROR: File not found: {input_file}")
+            self.log(f"[!] ERROR: File not found: {input_file}")
             return False
 
         file_size = os.path.getsize(input_file) / (1024 * 1024)
-        print(f"[*] Input: {input_file} ({file_size:.2f} MB)")
-        print()
+        self.log(f"[*] Input: {input_file} ({file_size:.2f} MB)")
+        self.log()
 
         # Detect format
         file_format = self.detect_format(input_file)
-        print(f"[*] Detected format: {file_format}")
-        print()
+        self.log(f"[*] Detected format: {file_format}")
+        self.log()
+
+        output_format = output_format or output_format_for(output_file)
+        if output_format == 'csv':
+            # CSV columns depend on every record, so collect them first
+            self.results = self.parse_file(input_file, file_format)
+            self.record_count = len(self.results)
+            records = self.normalize_data(self.results) if self.results else None
+        else:
+            # Map writers take one record at a time: stream from the parser
+            self.log(f"[*] Streaming {file_format} records to the {output_format} writer")
+            try:
+                records = self.stream_records(input_file, file_format)
+            except Exception as e:
+                self.log(f"[!] Error parsing {input_file}: {e}")
+                return False
+
+        self.log()
+
+        if not records:
+            self.log("[!] No data extracted!")
+            return False
 
-        # Parse based on format
-        if file_format == 'kml':
-            self.results = self.parse_kml(input_file)
-        elif file_format == 'kmz':
-            self.results = self.parse_kmz(input_file)
-        elif file_format == 'wigle_csv':
-            self.results = self.parse_wigle_csv(input_file)
-        elif file_format == 'kismet_csv':
-            self.results = self.parse_kismet_csv(input_file)
-        elif file_format == 'kismet_netxml':
-            self.results = self.parse_kismet_netxml(input_file)
-        elif file_format in ['generic_text', 'generic_gps_text']:
-            self.results = self.parse_generic_text(input_file)
+        success = self.write_output(records, output_file, output_format)
+
+        self.log()
+        self.log("=" * 70)
+        if success:
+            self.log("[+] CONVERSION COMPLETE!")
         else:
-            print(f"[!] Format '{file_format}' not yet implemented, trying generic parser")
-            self.results = self.parse_generic_text(input_file)
+            self.log("[!] CONVERSION FAILED!")
+        self.log("=" * 70)
 
-        print()
+        return success
+
+    def follow(self, input_file, output_file=None, interval=2.0, max_polls=None):
+        """Tail a growing log, appending newly logged records to the output CSV"""
+        # Auto-generate output filename (never the log being followed)
+        if not output_file:
+            output_file = default_output_file(input_file)
+
+        self.log("=" * 70)
+        self.log("  FOLLOW MODE (LIVE LOG)")
+        self.log("=" * 70)
+        self.log()
 
-        if not self.results:
-            print("[!] No data extracted!")
+        if not os.path.exists(input_file):
+            self.log(f"[!] ERROR: File not found: {input_file}")
             return False
 
-        # Normalize and write
-        normalized = self.normalize_data(self.results)
-        success = self.write_csv(normalized, output_file)
+        file_format = self.detect_format(input_file)
+        self.log(f"[*] Detected format: {file_format}")
 
-        print()
-        print("=" * 70)
+        follower = LogFollower(input_file, file_format, self)
+        if not follower.supported:
+            self.log(f"[!] ERROR: Format '{file_format}' cannot be followed")
+            return False
+
+        self.log(f"[*] Output: {output_file}")
+        self.log(f"[*] Polling every {interval:g}s (Ctrl+C to stop)")
+        self.log()
+
+        fieldnames = None
+        total = 0
+        polls = 0
+
+        try:
+            while max_polls is None or polls < max_polls:
+                if polls:
+                    time.sleep(interval)
+                polls += 1
+
+                records = follower.poll()
+                if not records:
+                    continue
+
+                normalized = self.normalize_data(records)
+                # Columns are fixed by the first batch so rows can be appended
+                write_header = fieldnames is None
+                if write_header:
+                    fieldnames = self._csv_fieldnames(normalized)
+                if self.append_csv(normalized, output_file, fieldnames, write_header):
+                    total += len(normalized)
+                    self.log(f"[+] Appended {len(normalized)} records "
+                             f"({total} total, offset {follower.offset})")
+
+        except KeyboardInterrupt:
+            self.log()
+            self.log("[*] Follow stopped")
+
+        self.log()
+        self.log("=" * 70)
+        self.log(f"[+] {total} records written to: {output_file}")
+        self.log("=" * 70)
+
+        return True
+
+    def locate(self, inputs, output_file, recursive=False, output_format=None):
+        """Estimate one location per access point from all observations"""
+        self.log("=" * 70)
+        self.log("  ACCESS POINT LOCATION ESTIMATE")
+        self.log("=" * 70)
+        self.log()
+
+        # Expand folders into their supported files
+        files = []
+        for path in inputs:
+            if os.path.isdir(path):
+                files.extend(self.find_files(path, recursive, os.path.join(path, 'converted')))
+            elif os.path.exists(path):
+                files.append(path)
+            else:
+                self.log(f"[!] Not found: {path}")
+
+        if not files:
+            self.log("[!] No input files to process!")
+            return False
+
+        locator = APLocator()
+        for i, filepath in enumerate(files, 1):
+            self.log(f"\n[{i}/{len(files)}] Processing: {os.path.basename(filepath)}")
+            self.log("-" * 70)
+            try:
+                file_format = self.detect_format(filepath)
+                results = self.parse_file(filepath, file_format)
+                used = locator.add_all(self.normalize_data(results))
+                self.log(f"[+] {used} observations with BSSID and GPS fix")
+            except Exception as e:
+                self.log(f"[!] ERROR processing {filepath}: {e}")
+
+        self.log()
+        self.log(f"[*] {locator.observations} observations of {len(locator.networks)} access points")
+
+        if not locator.networks:
+            self.log("[!] No observations with BSSID and GPS coordinates!")
+            return False
+
+        success = self.write_output(list(locator.estimates()), output_file, output_format)
+
+        self.log()
+        self.log("=" * 70)
         if success:
-            print("[+] CONVERSION COMPLETE!")
+            self.log("[+] LOCATION ESTIMATE COMPLETE!")
         else:
-            print("[!] CONVERSION FAILED!")
-        print("=" * 70)
+            self.log("[!] LOCATION ESTIMATE FAILED!")
+        self.log("=" * 70)
 
         return success
 
-    def batch_convert_folder(self, folder_path, output_folder=None, merge=False, recursive=False):
+    def batch_convert_folder(self, folder_path, output_folder=None, merge=False, recursive=False,
+                             output_format='csv'):
         """Batch convert all wardriving files in a folder"""
-        print("=" * 70)
-        print("  BATCH FOLDER CONVERSION")
-        print("=" * 70)
-        print()
+        self.log("=" * 70)
+        self.log("  BATCH FOLDER CONVERSION")
+        self.log("=" * 70)
+        self.log()
 
         if not os.path.isdir(folder_path):
-            print(f"[!] ERROR: Not a directory: {folder_path}")
+            self.log(f"[!] ERROR: Not a directory: {folder_path}")
             return False
 
         # Setup output folder
@@ -576,130 +903,1177 @@ class WardriveConverter:
             output_folder = os.path.join(folder_path, 'converted')
 
         os.makedirs(output_folder, exist_ok=True)
-        print(f"[*] Input folder: {folder_path}")
-        print(f"[*] Output folder: {output_folder}")
-        print(f"[*] Merge files: {'YES' if merge else 'NO'}")
-        print(f"[*] Recursive scan: {'YES' if recursive else 'NO'}")
-        print()
-
-        # Supported extensions
-        supported_exts = ['.kml', '.kmz', '.csv', '.xml', '.netxml', '.gpsxml', '.txt', '.ns1', '.nss']
+        self.log(f"[*] Input folder: {folder_path}")
+        self.log(f"[*] Output folder: {output_folder}")
+        self.log(f"[*] Merge files: {'YES' if merge else 'NO'}")
+        self.log(f"[*] Recursive scan: {'YES' if recursive else 'NO'}")
+        self.log(f"[*] Output format: {output_format}")
+        self.log()
 
-        # Find all supported files
-        files_to_convert = []
-        if recursive:
-            for root, dirs, files in os.walk(folder_path):
-                # Skip output folder
-                if root.startswith(output_folder):
-                    continue
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in supported_exts):
-                        files_to_convert.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(folder_path):
-                filepath = os.path.join(folder_path, file)
-                if os.path.isfile(filepath) and any(file.lower().endswith(ext) for ext in supported_exts):
-                    files_to_convert.append(filepath)
+        files_to_convert = self.find_files(folder_path, recursive, output_folder)
 
         if not files_to_convert:
-            print("[!] No supported files found in folder!")
-            print(f"    Supported: {', '.join(supported_exts)}")
+            self.log("[!] No supported files found in folder!")
+            self.log(f"    Supported: {', '.join(SUPPORTED_EXTENSIONS)}")
             return False
 
-        print(f"[*] Found {len(files_to_convert)} files to convert")
-        print()
+        self.log(f"[*] Found {len(files_to_convert)} files to convert")
+        self.log()
 
         # Convert each file
         successful = []
         failed = []
         all_data = []
+        ext = output_extension(output_format)
 
-        for i, filepath in enumerate(files_to_convert, 1):
-            filename = os.path.basename(filepath)
-            print(f"\n[{i}/{len(files_to_convert)}] Processing: {filename}")
-            print("-" * 70)
+        # Map formats stream the merged output instead of collecting it
+        merged_file = os.path.join(output_folder, 'merged_all' + ext)
+        merged_writer = None
+        if merge and output_format != 'csv':
+            merged_writer = open_writer(output_format, merged_file, self.verbose)
 
-            try:
-                # Create new converter instance for each file
-                converter = WardriveConverter()
-
-                # Detect and parse
-                file_format = converter.detect_format(filepath)
-                print(f"[*] Detected format: {file_format}")
-
-                # Parse based on format
-                if file_format == 'kml':
-                    results = converter.parse_kml(filepath)
-                elif file_format == 'kmz':
-                    results = converter.parse_kmz(filepath)
-                elif file_format == 'wigle_csv':
-                    results = converter.parse_wigle_csv(filepath)
-                elif file_format == 'kismet_csv':
-                    results = converter.parse_kismet_csv(filepath)
-                elif file_format == 'kismet_netxml':
-                    results = converter.parse_kismet_netxml(filepath)
-                elif file_format in ['generic_text', 'generic_gps_text']:
-                    results = converter.parse_generic_text(filepath)
-                else:
-                    print(f"[!] Unknown format, trying generic parser")
-                    results = converter.parse_generic_text(filepath)
-
-                if results:
-                    normalized = converter.normalize_data(results)
-
-                    if merge:
-                        # Add to master list
-                        all_data.extend(normalized)
-                        print(f"[+] Added {len(normalized)} records to merged dataset")
+        # Always finish the merged writer, even on an error or Ctrl-C, so it
+        # is not left truncated (or, for MBTiles, staged but never tiled)
+        try:
+            for i, filepath in enumerate(files_to_convert, 1):
+                filename = os.path.basename(filepath)
+                self.log(f"\n[{i}/{len(files_to_convert)}] Processing: {filename}")
+                self.log("-" * 70)
+
+                try:
+                    # Create new converter instance for each file
+                    converter = WardriveConverter(self.verbose)
+
+                    # Detect and parse
+                    file_format = converter.detect_format(filepath)
+                    self.log(f"[*] Detected format: {file_format}")
+
+                    if output_format == 'csv':
+                        results = converter.parse_file(filepath, file_format)
+                        normalized = converter.normalize_data(results) if results else None
+                    else:
+                        normalized = converter.stream_records(filepath, file_format)
+
+                    if normalized:
+                        if merged_writer:
+                            for record in normalized:
+                                merged_writer.write(record)
+                            self.log(f"[+] Streamed {converter.record_count} records to merged dataset")
+                        elif merge:
+                            # Add to master list
+                            all_data.extend(normalized)
+                            self.log(f"[+] Added {len(normalized)} records to merged dataset")
+                        else:
+                            # Write individual file
+                            output_file = os.path.join(output_folder, os.path.splitext(filename)[0] + '_converted' + ext)
+                            converter.write_output(normalized, output_file, output_format)
+
+                        successful.append(filename)
                     else:
-                        # Write individual file
-                        output_file = os.path.join(output_folder, Path(filename).stem + '_converted.csv')
-                        converter.write_csv(normalized, output_file)
+                        self.log(f"[!] No data extracted from {filename}")
+                        failed.append(filename)
 
-                    successful.append(filename)
-                else:
-                    print(f"[!] No data extracted from {filename}")
+                except Exception as e:
+                    self.log(f"[!] ERROR processing {filename}: {e}")
                     failed.append(filename)
+        finally:
+            if merged_writer:
+                self.log(f"\n[*] Finishing merged dataset: {merged_file}")
+                merged_writer.close()
 
-            except Exception as e:
-                print(f"[!] ERROR processing {filename}: {e}")
-                failed.append(filename)
-
-        print()
-        print("=" * 70)
-        print("  BATCH CONVERSION COMPLETE")
-        print("=" * 70)
-        print()
+        self.log()
+        self.log("=" * 70)
+        self.log("  BATCH CONVERSION COMPLETE")
+        self.log("=" * 70)
+        self.log()
 
         # Write merged file if requested
-        if merge and all_data:
-            merged_file = os.path.join(output_folder, 'merged_all.csv')
-            print(f"[*] Writing merged dataset: {merged_file}")
-            dummy_converter = WardriveConverter()
+        if merged_writer:
+            self.report_written(merged_writer)
+            self.log()
+        elif merge and all_data:
+            self.log(f"[*] Writing merged dataset: {merged_file}")
+            dummy_converter = WardriveConverter(self.verbose)
             dummy_converter.write_csv(all_data, merged_file)
-            print()
+            self.log()
 
         # Summary
-        print(f"[+] Successfully converted: {len(successful)} files")
+        self.log(f"[+] Successfully converted: {len(successful)} files")
         if failed:
-            print(f"[!] Failed: {len(failed)} files")
+            self.log(f"[!] Failed: {len(failed)} files")
             for f in failed:
-                print(f"    - {f}")
+                self.log(f"    - {f}")
 
-        print()
-        print(f"[+] Output location: {output_folder}")
-        print("=" * 70)
+        self.log()
+        self.log(f"[+] Output location: {output_folder}")
+        self.log("=" * 70)
 
         return len(successful) > 0
 
 
+class LogFollower:
+    """Incremental reader for a log file that is still being written
+
+    Keeps the byte offset of everything consumed so far, plus the CSV header
+    and any partial trailing line, or the live XML pull parser for XML logs.
+    Each poll only reads and parses bytes appended since the last one.
+
+    A file that was replaced (new inode), truncated, or rewritten in place
+    (the bytes already consumed changed) is re-read from the top. NetXML
+    and KML are rewritten as whole documents, so for those only records
+    not emitted before are returned, unless dedupe is False (one-shot reads
+    that must match parse_file).
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    FINGERPRINT_SIZE = 256
+
+    def __init__(self, filepath, file_format, converter=None, dedupe=True):
+        self.filepath = filepath
+        self.file_format = file_format
+        self.converter = converter or WardriveConverter()
+        self.record_tag = FOLLOW_XML_TAGS.get(file_format)
+        self.supported = (file_format in FOLLOW_CSV_FORMATS or
+                          file_format in FOLLOW_TEXT_FORMATS or
+                          self.record_tag is not None)
+        self.snapshot = dedupe and file_format in FOLLOW_SNAPSHOT_FORMATS
+        self._emitted = set()
+        self.reset()
+
+    def reset(self):
+        """Forget all progress and start again from the top of the file"""
+        self.offset = 0
+        self._pending = b''
+        self._header = None
+        self._xml_parser = None
+        self._xml_stack = []
+        self._identity = None
+        self._stamp = None
+        self._fingerprint = None
+
+    def _read_fingerprint(self, f, offset):
+        """First bytes of the file plus the bytes just before offset"""
+        f.seek(0)
+        head = f.read(min(self.FINGERPRINT_SIZE, offset))
+        start = max(offset - self.FINGERPRINT_SIZE, 0)
+        f.seek(start)
+        return head, f.read(offset - start)
+
+    def _rewritten(self, stat):
+        """True if the bytes already consumed are no longer in the file"""
+        if not self.offset:
+            return False
+        if (stat.st_dev, stat.st_ino) != self._identity or stat.st_size < self.offset:
+            return True
+        if (stat.st_size, stat.st_mtime_ns) == self._stamp:
+            return False
+        with open(self.filepath, 'rb') as f:
+            return self._read_fingerprint(f, self.offset) != self._fingerprint
+
+    def _new_only(self, records):
+        """Drop records already emitted, for snapshot formats"""
+        for data in records:
+            if self.snapshot:
+                key = tuple(sorted(data.items()))
+                if self.file_format == 'kismet_netxml' and data.get('bssid'):
+                    key = data['bssid'].strip().upper()
+                if key in self._emitted:
+                    continue
+                self._emitted.add(key)
+            yield data
+
+    def poll(self, final=False):
+        """Return raw records appended since the previous poll"""
+        return list(self.iter_new(final))
+
+    def iter_new(self, final=False):
+        """Yield raw records appended since the previous poll
+
+        With final=True (a one-shot read of a finished file) an unterminated
+        last line is parsed too, and read or XML errors are raised instead
+        of waiting for the next poll; leave it False while the file is
+        still growing.
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except OSError as e:
+            if final:
+                raise
+            self.converter.log(f"[!] Cannot read {self.filepath}: {e}")
+            return
+
+        if self._rewritten(stat):
+            self.converter.log(f"[!] {self.filepath} was rewritten, re-reading from the start")
+            self.reset()
+
+        try:
+            with open(self.filepath, 'rb') as f:
+                f.seek(self.offset)
+                while True:
+                    chunk = f.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    self.offset += len(chunk)
+                    yield from self._new_only(self._feed(chunk))
+
+                self._identity = (stat.st_dev, stat.st_ino)
+                self._stamp = (stat.st_size, stat.st_mtime_ns)
+                self._fingerprint = self._read_fingerprint(f, self.offset)
+
+            if final and self._pending:
+                line = self._pending.decode('utf-8', errors='ignore')
+                self._pending = b''
+                yield from self._new_only(self._parse_lines([line]))
+
+            # Closing the parser raises if the document is incomplete
+            if final and self.record_tag:
+                yield from self._new_only(self._feed_xml(None))
+
+        except ET.ParseError as e:
+            if final:
+                raise
+            # Usually caught mid-rewrite; start over next poll
+            self.converter.log(f"[!] XML parse error in {self.filepath}: {e}")
+            self.reset()
+
+    def _feed(self, chunk):
+        """Parse a chunk of newly appended bytes"""
+        if self.record_tag:
+            return self._feed_xml(chunk)
+
+        # Only hand complete lines to the parser; keep the rest for next time
+        data = self._pending + chunk
+        cut = data.rfind(b'\n') + 1
+        self._pending = data[cut:]
+        if not cut:
+            return []
+        lines = data[:cut].decode('utf-8', errors='ignore').split('\n')
+        return self._parse_lines(lines[:-1])
+
+    def _parse_lines(self, lines):
+        """Turn complete text lines into raw records"""
+        lines = [line.rstrip('\r') for line in lines]
+
+        if self.file_format not in FOLLOW_CSV_FORMATS:
+            results = []
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                data = self.converter._parse_text_line(line)
+                if data:
+                    results.append(data)
+            return results
+
+        # CSV logs: the first non-comment line is the header
+        if self._header is None:
+            while lines and (not lines[0].strip() or lines[0].startswith('#')):
+                lines.pop(0)
+            if not lines:
+                return []
+            self._header = next(csv.reader([lines.pop(0)]))
+
+        if self.file_format == 'wigle_csv':
+            map_row = self.converter._map_wigle_row
+        else:
+            map_row = self.converter._map_kismet_csv_row
+
+        reader = csv.DictReader(lines, fieldnames=self._header)
+        return [map_row(row) for row in reader]
+
+    def _feed_xml(self, chunk):
+        """Feed bytes to the pull parser and yield finished records
+
+        A chunk of None closes the parser. Records completed before a parse
+        error are still yielded, then the error is raised.
+        """
+        if self._xml_parser is None:
+            self._xml_parser = ET.XMLPullParser(events=('start', 'end'))
+
+        error = None
+        try:
+            if chunk is None:
+                self._xml_parser.close()
+            else:
+                self._xml_parser.feed(chunk)
+        except ET.ParseError as e:
+            error = e
+
+        for event, elem in self._xml_parser.read_events():
+            if event == 'start':
+                self._xml_stack.append(elem)
+                continue
+
+            self._xml_stack.pop()
+            if elem.tag != self.record_tag:
+                continue
+
+            if self.file_format == 'kml':
+                data = self.converter._parse_placemark(elem)
+            else:
+                data = self.converter._parse_netxml_network(elem)
+            if data:
+                yield data
+
+            # Drop finished records so memory stays flat on long drives
+            if self._xml_stack:
+                self._xml_stack[-1].remove(elem)
+
+        if error is not None:
+            raise error
+
+
+def output_format_for(output_file):
+    """Pick the output format from a file extension (CSV if unknown)"""
+    return OUTPUT_EXTENSIONS.get(os.path.splitext(output_file)[1].lower(), 'csv')
+
+
+def output_extension(output_format):
+    """Default file extension for an output format"""
+    for ext, fmt in OUTPUT_EXTENSIONS.items():
+        if fmt == output_format:
+            return ext
+    return '.csv'
+
+
+def default_output_file(input_file, output_format=None, tag=''):
+    """Output path next to the input file, never the input file itself"""
+    base = os.path.splitext(input_file)[0]
+    ext = output_extension(output_format or 'csv')
+    output_file = base + tag + ext
+    if os.path.abspath(output_file) == os.path.abspath(input_file):
+        output_file = base + '_converted' + ext
+    return output_file
+
+
+def record_point(record):
+    """Return (lon, lat, alt) for a record, or None without a usable GPS fix"""
+    try:
+        lat = float(record.get('latitude') or '')
+        lon = float(record.get('longitude') or '')
+    except (TypeError, ValueError):
+        return None
+
+    # 0,0 is what most loggers write before the GPS has a fix
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180) or (lat == 0 and lon == 0):
+        return None
+
+    try:
+        alt = float(record.get('altitude') or '')
+    except (TypeError, ValueError):
+        alt = None
+    if alt is not None and math.isnan(alt):
+        alt = None
+
+    return lon, lat, alt
+
+
+def encryption_class(encryption):
+    """Bucket an encryption string into open/wep/wpa/wpa2/wpa3/unknown"""
+    value = (encryption or '').upper()
+    if 'WPA3' in value or 'SAE' in value:
+        return 'wpa3'
+    if 'WPA2' in value or 'RSN' in value:
+        return 'wpa2'
+    if 'WPA' in value:
+        return 'wpa'
+    if 'WEP' in value:
+        return 'wep'
+    if 'OPEN' in value or 'NONE' in value or value in ('[ESS]', '[IBSS]'):
+        return 'open'
+    return 'unknown'
+
+
+class MapWriter:
+    """Base class for streaming map writers
+
+    Records are written one at a time as they arrive, so the full dataset
+    never has to be held in memory. Records without coordinates are skipped.
+    """
+
+    def __init__(self, output_file, verbose=True):
+        self.output_file = output_file
+        self.verbose = verbose
+        self.written = 0
+        self.skipped = 0
+
+    def log(self, *args, **kwargs):
+        """Print progress output unless the writer is quiet"""
+        if self.verbose:
+            print(*args, **kwargs)
+
+    def write(self, record):
+        """Write one normalized record; returns False if it had no GPS fix"""
+        point = record_point(record)
+        if point is None:
+            self.skipped += 1
+            return False
+
+        self._write_point(record, *point)
+        self.written += 1
+        return True
+
+    def _write_point(self, record, lon, lat, alt):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class GeoJSONWriter(MapWriter):
+    """Write a GeoJSON FeatureCollection one feature at a time"""
+
+    def __init__(self, output_file, verbose=True):
+        super().__init__(output_file, verbose)
+        self._file = open(output_file, 'w', encoding='utf-8')
+        self._start()
+
+    def _start(self):
+        self._file.write('{"type": "FeatureCollection", "features": [\n')
+
+    def _feature(self, record, lon, lat, alt):
+        coordinates = [lon, lat] if alt is None else [lon, lat, alt]
+        properties = {k: v for k, v in record.items()
+                      if k not in ('latitude', 'longitude', 'altitude')}
+        return json.dumps({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': coordinates},
+            'properties': properties,
+        }, ensure_ascii=False)
+
+    def _write_point(self, record, lon, lat, alt):
+        if self.written:
+            self._file.write(',\n')
+        self._file.write(self._feature(record, lon, lat, alt))
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write('\n]}\n')
+        self._file.close()
+
+
+class GeoJSONLinesWriter(GeoJSONWriter):
+    """Write newline-delimited GeoJSON (one Feature per line)"""
+
+    def _start(self):
+        pass
+
+    def _write_point(self, record, lon, lat, alt):
+        self._file.write(self._feature(record, lon, lat, alt) + '\n')
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class KMLWriter(MapWriter):
+    """Write KML placemarks styled by encryption type"""
+
+    # KML colours are aabbggrr
+    STYLES = {
+        'open': 'ff00ff00',
+        'wep': 'ff0000ff',
+        'wpa': 'ff0080ff',
+        'wpa2': 'ff00ffff',
+        'wpa3': 'ffff8000',
+        'unknown': 'ff888888',
+    }
+
+    # Characters XML 1.0 does not allow at all, even escaped
+    ILLEGAL_CHARS = dict.fromkeys([c for c in range(32) if c not in (9, 10, 13)] + [0xFFFE, 0xFFFF])
+
+    # Description lines use the same "Key: value" layout parse_kml reads
+    DESCRIPTION_FIELDS = [('ssid', 'SSID'), ('bssid', 'BSSID'), ('channel', 'Channel'),
+                          ('signal', 'Signal'), ('encryption', 'Encryption'),
+                          ('type', 'Type'), ('timestamp', 'Timestamp')]
+
+    def __init__(self, output_file, verbose=True):
+        super().__init__(output_file, verbose)
+        self._file = open(output_file, 'w', encoding='utf-8')
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._file.write(f'<kml xmlns="{KML_NS["kml"]}">\n<Document>\n')
+        self._file.write(f'<name>{self._text(os.path.splitext(os.path.basename(output_file))[0])}</name>\n')
+        for name, color in self.STYLES.items():
+            self._file.write(f'<Style id="enc_{name}"><IconStyle><color>{color}</color>'
+                             f'</IconStyle></Style>\n')
+
+    def _text(self, value):
+        """Escape element text, dropping characters XML cannot contain"""
+        return saxutils.escape(str(value).translate(self.ILLEGAL_CHARS))
+
+    def _write_point(self, record, lon, lat, alt):
+        name = record.get('ssid') or record.get('bssid') or 'Unknown'
+        description = '\n'.join(f'{label}: {record[key]}' for key, label in self.DESCRIPTION_FIELDS
+                                if record.get(key))
+        coordinates = f'{lon},{lat}' if alt is None else f'{lon},{lat},{alt}'
+
+        parts = ['<Placemark>',
+                 f'<name>{self._text(name)}</name>',
+                 f'<styleUrl>#enc_{encryption_class(record.get("encryption"))}</styleUrl>',
+                 f'<description>{self._text(description)}</description>']
+
+        extras = [(k, v) for k, v in record.items() if k not in STANDARD_FIELDS and v]
+        if extras:
+            parts.append('<ExtendedData>')
+            for key, value in extras:
+                parts.append(f'<Data name={saxutils.quoteattr(key.translate(self.ILLEGAL_CHARS))}>'
+                             f'<value>{self._text(value)}</value></Data>')
+            parts.append('</ExtendedData>')
+
+        parts.append(f'<Point><coordinates>{coordinates}</coordinates></Point>')
+        parts.append('</Placemark>\n')
+        self._file.write(''.join(parts))
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write('</Document>\n</kml>\n')
+        self._file.close()
+
+
+def _pb_varint(value):
+    """Protocol buffer varint encoding"""
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _pb_uint(field, value):
+    return _pb_varint(field << 3) + _pb_varint(value)
+
+
+def _pb_bytes(field, data):
+    return _pb_varint((field << 3) | 2) + _pb_varint(len(data)) + data
+
+
+def _pb_packed(field, values):
+    return _pb_bytes(field, b''.join(_pb_varint(v) for v in values))
+
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+class MBTilesWriter(MapWriter):
+    """Write pre-tiled Mapbox vector tiles into an MBTiles (SQLite) file
+
+    Points are staged in the output database as they arrive, keyed by their
+    quadkey at max_zoom. Tiles for every zoom level are then built in one
+    ordered scan per zoom, so memory use stays bounded by a single tile.
+    """
+
+    EXTENT = 4096
+    LAYER = 'networks'
+    TILE_FIELDS = ['ssid', 'bssid', 'signal', 'channel', 'encryption', 'type', 'timestamp']
+    MAX_TILE_FEATURES = 10000
+    BATCH_SIZE = 10000
+
+    def __init__(self, output_file, verbose=True, min_zoom=0, max_zoom=14):
+        super().__init__(output_file, verbose)
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.bounds = [180.0, 85.0511, -180.0, -85.0511]
+        self._batch = []
+
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        self._db = sqlite3.connect(output_file)
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('CREATE TABLE metadata (name TEXT, value TEXT)')
+        self._db.execute('CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, '
+                         'tile_row INTEGER, tile_data BLOB)')
+        self._db.execute('CREATE TABLE _points (quadkey INTEGER, gx INTEGER, gy INTEGER, props TEXT)')
+
+    def _write_point(self, record, lon, lat, alt):
+        # Web Mercator, in tile pixel units at max_zoom
+        lat = max(min(lat, 85.0511), -85.0511)
+        world = self.EXTENT << self.max_zoom
+        gx = min(int((lon + 180.0) / 360.0 * world), world - 1)
+        rad = math.radians(lat)
+        gy = int((1.0 - math.log(math.tan(rad) + 1.0 / math.cos(rad)) / math.pi) / 2.0 * world)
+        gy = max(min(gy, world - 1), 0)
+
+        tx, ty = gx // self.EXTENT, gy // self.EXTENT
+        quadkey = 0
+        for bit in range(self.max_zoom - 1, -1, -1):
+            quadkey = (quadkey << 2) | (((ty >> bit) & 1) << 1) | ((tx >> bit) & 1)
+
+        props = {k: str(record[k]) for k in self.TILE_FIELDS if record.get(k)}
+        props['security'] = encryption_class(record.get('encryption'))
+
+        self.bounds = [min(self.bounds[0], lon), min(self.bounds[1], lat),
+                       max(self.bounds[2], lon), max(self.bounds[3], lat)]
+        self._batch.append((quadkey, gx, gy, json.dumps(props, ensure_ascii=False)))
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        self._db.executemany('INSERT INTO _points VALUES (?, ?, ?, ?)', self._batch)
+        self._batch = []
+
+    def _encode_tile(self, points):
+        """Encode (x, y, props) points as a gzipped single-layer vector tile"""
+        keys, key_index = [], {}
+        values, value_index = [], {}
+        features = []
+
+        for x, y, props in points:
+            tags = []
+            for key, value in json.loads(props).items():
+                if key not in key_index:
+                    key_index[key] = len(keys)
+                    keys.append(key)
+                if value not in value_index:
+                    value_index[value] = len(values)
+                    values.append(value)
+                tags += [key_index[key], value_index[value]]
+
+            # MoveTo(1) command followed by the zigzag-encoded position
+            feature = _pb_packed(2, tags) + _pb_uint(3, 1) + _pb_packed(4, [9, _zigzag(x), _zigzag(y)])
+            features.append(_pb_bytes(2, feature))
+
+        layer = (_pb_uint(15, 2) + _pb_bytes(1, self.LAYER.encode()) + b''.join(features) +
+                 b''.join(_pb_bytes(3, k.encode('utf-8')) for k in keys) +
+                 b''.join(_pb_bytes(4, _pb_bytes(1, v.encode('utf-8'))) for v in values) +
+                 _pb_uint(5, self.EXTENT))
+        return gzip.compress(_pb_bytes(3, layer))
+
+    def _build_zoom(self, zoom):
+        shift = self.max_zoom - zoom
+        tiles = 0
+        rows = self._db.execute('SELECT quadkey, gx, gy, props FROM _points ORDER BY quadkey')
+
+        for quadkey, group in groupby(rows, key=lambda row: row[0] >> (2 * shift)):
+            points = []
+            seen = set()
+            for _, gx, gy, props in group:
+                px, py = gx >> shift, gy >> shift
+                # Below max_zoom, one feature per pixel is all that can be seen
+                if shift and (px, py) in seen:
+                    continue
+                seen.add((px, py))
+                points.append((px % self.EXTENT, py % self.EXTENT, props))
+                if len(points) >= self.MAX_TILE_FEATURES:
+                    break
+
+            tx, ty = px // self.EXTENT, py // self.EXTENT
+            tms_row = (1 << zoom) - 1 - ty
+            self._db.execute('INSERT INTO tiles VALUES (?, ?, ?, ?)',
+                             (zoom, tx, tms_row, self._encode_tile(points)))
+            tiles += 1
+
+        return tiles
+
+    def close(self):
+        if self._db is None:
+            return
+
+        if self._batch:
+            self._flush()
+
+        if self.written:
+            self._db.execute('CREATE INDEX _points_quadkey ON _points (quadkey)')
+            for zoom in range(self.min_zoom, self.max_zoom + 1):
+                tiles = self._build_zoom(zoom)
+                self.log(f"[*] Zoom {zoom}: {tiles} tiles")
+        self._db.execute('DROP TABLE _points')
+        self._db.execute('CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)')
+
+        west, south, east, north = self.bounds if self.written else (-180, -85.0511, 180, 85.0511)
+        fields = {name: 'String' for name in self.TILE_FIELDS + ['security']}
+        metadata = {
+            'name': os.path.splitext(os.path.basename(self.output_file))[0],
+            'format': 'pbf',
+            'type': 'overlay',
+            'version': '1',
+            'description': 'Wardriving networks',
+            'minzoom': str(self.min_zoom),
+            'maxzoom': str(self.max_zoom),
+            'bounds': f'{west},{south},{east},{north}',
+            'center': f'{(west + east) / 2},{(south + north) / 2},{self.max_zoom}',
+            'json': json.dumps({'vector_layers': [{
+                'id': self.LAYER, 'fields': fields,
+                'minzoom': self.min_zoom, 'maxzoom': self.max_zoom}]}),
+        }
+        self._db.executemany('INSERT INTO metadata VALUES (?, ?)', metadata.items())
+        self._db.commit()
+        self._db.execute('VACUUM')
+        self._db.close()
+        self._db = None
+
+
+OUTPUT_WRITERS = {
+    'geojson': GeoJSONWriter,
+    'geojsonl': GeoJSONLinesWriter,
+    'kml': KMLWriter,
+    'mbtiles': MBTilesWriter,
+}
+
+
+def open_writer(output_format, output_file, verbose=True):
+    """Open a streaming map writer for one of the OUTPUT_WRITERS formats"""
+    if output_format not in OUTPUT_WRITERS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    return OUTPUT_WRITERS[output_format](output_file, verbose)
+
+
+def signal_weight(signal):
+    """Weight an observation by signal strength (stronger = closer to the AP)"""
+    try:
+        dbm = float(signal)
+    except (TypeError, ValueError):
+        dbm = -100.0
+    if math.isnan(dbm):
+        dbm = -100.0
+
+    # Some tools log signal quality as 0-100 instead of dBm
+    if dbm > 0:
+        dbm = dbm / 2.0 - 100.0
+    dbm = max(min(dbm, -20.0), -100.0)
+
+    # Amplitude scale: every 6 dB stronger doubles the weight
+    return 10 ** (dbm / 20.0)
+
+
+class APLocator:
+    """Estimate one location per BSSID from many observations
+
+    Observations are bucketed per BSSID into a lat/lon grid that only keeps
+    running weighted sums per cell, so memory grows with the number of
+    occupied cells rather than the number of observations. The cluster is
+    the window of cells within cluster_cells of a centre cell that holds the
+    most observations (ties go to the larger total weight), so one strong
+    reading cannot outvote a consistent group. The estimate is the signal-
+    weighted centroid of that cluster; observations outside it (GPS
+    glitches, moving hotspots) are counted as outliers instead of dragging
+    the centroid.
+    """
+
+    METERS_PER_DEGREE = 111320.0
+    GPS_ERROR_M = 10.0
+
+    def __init__(self, cell_size=0.001, cluster_cells=2):
+        self.cell_size = cell_size
+        self.cluster_cells = cluster_cells
+        self.networks = {}
+        self.observations = 0
+
+    def add(self, record):
+        """Add one normalized observation; returns False if unusable"""
+        # Tools differ on separators (AA-BB-... vs AA:BB:...); key on one form
+        bssid = (record.get('bssid') or '').strip().upper().replace('-', ':')
+        point = record_point(record)
+        if not bssid or point is None:
+            return False
+
+        lon, lat, _ = point
+        weight = signal_weight(record.get('signal'))
+
+        network = self.networks.get(bssid)
+        if network is None:
+            network = self.networks[bssid] = {'cells': {}, 'info': {}}
+
+        # Keep the first non-empty descriptive value seen for the AP
+        for key in ('ssid', 'channel', 'encryption', 'type'):
+            if record.get(key) and key not in network['info']:
+                network['info'][key] = record[key]
+
+        # Sums are kept relative to the cell corner to avoid precision loss
+        row = math.floor(lat / self.cell_size)
+        col = math.floor(lon / self.cell_size)
+        dlat = lat - row * self.cell_size
+        dlon = lon - col * self.cell_size
+
+        cell = network['cells'].get((row, col))
+        if cell is None:
+            cell = network['cells'][(row, col)] = [0, 0.0, 0.0, 0.0, 0.0, 0.0, None]
+        cell[0] += 1
+        cell[1] += weight
+        cell[2] += weight * dlat
+        cell[3] += weight * dlon
+        cell[4] += weight * dlat * dlat
+        cell[5] += weight * dlon * dlon
+
+        # Strongest reading in the cell, so it can be taken from the cluster
+        try:
+            signal = float(record.get('signal'))
+        except (TypeError, ValueError):
+            signal = None
+        if signal is not None and not math.isnan(signal):
+            if cell[6] is None or signal > cell[6]:
+                cell[6] = signal
+
+        self.observations += 1
+        return True
+
+    def add_all(self, records):
+        """Add many observations; returns how many were usable"""
+        return sum(1 for record in records if self.add(record))
+
+    def _window(self, cells, center):
+        """Yield (row offset, col offset, cell) for occupied cells around center"""
+        span = range(-self.cluster_cells, self.cluster_cells + 1)
+        for drow in span:
+            for dcol in span:
+                cell = cells.get((center[0] + drow, center[1] + dcol))
+                if cell is not None:
+                    yield drow, dcol, cell
+
+    def _cluster_size(self, cells, center):
+        """(observations, total weight) of the window around center"""
+        count = weight = 0
+        for _, _, cell in self._window(cells, center):
+            count += cell[0]
+            weight += cell[1]
+        return count, weight
+
+    def estimate(self, bssid):
+        """Estimated location record for one BSSID"""
+        network = self.networks[bssid]
+        cells = network['cells']
+
+        center = max(cells, key=lambda key: self._cluster_size(cells, key))
+        count = weight = sum_lat = sum_lon = sq_lat = sq_lon = 0.0
+        best = None
+
+        for drow, dcol, cell in self._window(cells, center):
+            # Shift cell sums to the centre cell's corner
+            olat = drow * self.cell_size
+            olon = dcol * self.cell_size
+            count += cell[0]
+            weight += cell[1]
+            sum_lat += cell[2] + olat * cell[1]
+            sum_lon += cell[3] + olon * cell[1]
+            sq_lat += cell[4] + 2 * olat * cell[2] + olat * olat * cell[1]
+            sq_lon += cell[5] + 2 * olon * cell[3] + olon * olon * cell[1]
+            if cell[6] is not None and (best is None or cell[6] > best):
+                best = cell[6]
+
+        mean_lat = sum_lat / weight
+        mean_lon = sum_lon / weight
+        var_lat = max(sq_lat / weight - mean_lat * mean_lat, 0.0)
+        var_lon = max(sq_lon / weight - mean_lon * mean_lon, 0.0)
+
+        lat = center[0] * self.cell_size + mean_lat
+        lon = center[1] * self.cell_size + mean_lon
+
+        # Weighted RMS spread of the observations, combined with GPS error
+        m_lat = self.METERS_PER_DEGREE
+        m_lon = self.METERS_PER_DEGREE * math.cos(math.radians(lat))
+        spread = var_lat * m_lat * m_lat + var_lon * m_lon * m_lon
+        radius = math.sqrt(spread + self.GPS_ERROR_M ** 2)
+
+        total = sum(cell[0] for cell in cells.values())
+
+        data = {
+            'ssid': network['info'].get('ssid', ''),
+            'bssid': bssid,
+            'latitude': f'{lat:.6f}',
+            'longitude': f'{lon:.6f}',
+            'signal': '' if best is None else f'{best:g}',
+            'channel': network['info'].get('channel', ''),
+            'encryption': network['info'].get('encryption', ''),
+            'type': network['info'].get('type', ''),
+            'error_radius_m': f'{radius:.1f}',
+            'observations': str(total),
+            'outliers': str(total - int(count)),
+        }
+        return data
+
+    def estimates(self):
+        """Yield one estimated location record per BSSID"""
+        for bssid in self.networks:
+            yield self.estimate(bssid)
+
+
+# Columns converted to float64 by iter_batches (NaN / null when missing)
+NUMERIC_FIELDS = ['latitude', 'longitude', 'altitude', 'signal']
+
+
+def iter_records(path, file_format=None, converter=None):
+    """Yield normalized records from a wardriving file without writing anything
+
+    Line-based and XML formats are streamed in chunks, so memory does not
+    grow with file size. Nothing is printed unless a verbose converter is
+    passed in. Malformed XML raises xml.etree.ElementTree.ParseError.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    converter = converter or WardriveConverter(verbose=False)
+    file_format = file_format or converter.detect_format(path)
+
+    follower = LogFollower(path, file_format, converter, dedupe=False)
+    if follower.supported:
+        records = follower.iter_new(final=True)
+    else:
+        records = converter.parse_file(path, file_format)
+
+    for data in records:
+        yield converter.normalize_record(data)
+
+
+def _float_or(value, missing):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return missing
+
+
+def _columnar_batch(records, columns, kind):
+    """Turn a list of records into one columnar batch"""
+    if kind == 'dict':
+        return {col: [_float_or(r.get(col), math.nan) for r in records] if col in NUMERIC_FIELDS
+                else [r.get(col) or '' for r in records] for col in columns}
+
+    if kind == 'numpy':
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("iter_batches(kind='numpy') needs numpy: pip install numpy") from e
+        return {col: np.array([_float_or(r.get(col), math.nan) for r in records], dtype=np.float64)
+                if col in NUMERIC_FIELDS
+                else np.array([r.get(col) or '' for r in records], dtype=object) for col in columns}
+
+    if kind == 'arrow':
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("iter_batches(kind='arrow') needs pyarrow: pip install pyarrow") from e
+        arrays = [pa.array([_float_or(r.get(col), None) for r in records], type=pa.float64())
+                  if col in NUMERIC_FIELDS
+                  else pa.array([r.get(col) or '' for r in records], type=pa.string()) for col in columns]
+        return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+    raise ValueError(f"Unknown batch kind: {kind} (use 'dict', 'numpy' or 'arrow')")
+
+
+def iter_batches(path, batch_size=65536, kind='dict', columns=None, file_format=None):
+    """Yield columnar batches of normalized records from a wardriving file
+
+    kind='dict' gives {column: list}, 'numpy' gives {column: ndarray} and
+    'arrow' gives a pyarrow.RecordBatch. latitude, longitude, altitude and
+    signal are float64 (NaN/null when missing); other columns are strings.
+    columns defaults to the standard output fields.
+    """
+    columns = list(columns or STANDARD_FIELDS)
+    batch = []
+    for record in iter_records(path, file_format):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield _columnar_batch(batch, columns, kind)
+            batch = []
+    if batch:
+        yield _columnar_batch(batch, columns, kind)
+
+
+def convert_many(paths, output_folder=None, output_format='csv', executor=None, verbose=False):
+    """Convert several files, optionally in parallel, and return one result per file
+
+    executor can be any concurrent.futures executor (a ProcessPoolExecutor
+    sidesteps the GIL for CPU-bound parsing); without one, files are
+    converted one after another. Results are dicts as returned by run_job,
+    in the same order as paths.
+    """
+    ext = output_extension(output_format)
+    if output_folder:
+        os.makedirs(output_folder, exist_ok=True)
+
+    jobs = []
+    used = set()
+    for path in paths:
+        if output_folder:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            output_file = os.path.join(output_folder, stem + '_converted' + ext)
+        else:
+            output_file = default_output_file(path, output_format)
+
+        # Same-named inputs (a/scan.csv, b/scan.csv) get numbered outputs
+        base = os.path.splitext(output_file)[0]
+        count = 2
+        while os.path.normcase(os.path.abspath(output_file)) in used:
+            output_file = f'{base}_{count}{ext}'
+            count += 1
+        used.add(os.path.normcase(os.path.abspath(output_file)))
+
+        jobs.append({'input': path, 'output': output_file, 'format': output_format})
+
+    if executor is None:
+        return [run_job(job, verbose) for job in jobs]
+    return list(executor.map(run_job, jobs, [verbose] * len(jobs)))
+
+
+def run_job(job, verbose=True):
+    """Run one conversion job (dict or "input [output]" line) and describe the result"""
+    if isinstance(job, str):
+        job = job.strip()
+        if job.startswith('{'):
+            job = json.loads(job)
+        else:
+            parts = job.split('\t') if '\t' in job else job.split()
+            job = {'input': parts[0]}
+            if len(parts) > 1:
+                job['output'] = parts[1]
+
+    output_format = job.get('format')
+    converter = WardriveConverter(verbose)
+
+    if job.get('folder'):
+        success = converter.batch_convert_folder(job['folder'], job.get('output'),
+                                                 merge=job.get('merge', False),
+                                                 recursive=job.get('recursive', False),
+                                                 output_format=output_format or 'csv')
+        return {'ok': success, 'folder': job['folder']}
+
+    input_file = job.get('input')
+    if not input_file:
+        return {'ok': False, 'error': 'job needs "input" or "folder"'}
+
+    if job.get('locate'):
+        output_file = job.get('output') or default_output_file(input_file, output_format, '_locations')
+        success = converter.locate([input_file], output_file, output_format=output_format)
+        return {'ok': success, 'input': input_file, 'output': output_file}
+
+    output_file = job.get('output') or default_output_file(input_file, output_format)
+    success = converter.convert(input_file, output_file, output_format)
+    return {'ok': success, 'input': input_file, 'output': output_file,
+            'records': converter.record_count}
+
+
+def serve(address=None):
+    """Run conversion jobs from stdin (or a local socket) in one long-lived process
+
+    One job per line, either JSON ({"input": ..., "output": ..., "format": ...,
+    "locate": ..., or "folder"/"merge"/"recursive"}) or "input [output]".
+    Each job gets one JSON reply line. Converter progress goes to stderr so
+    the reply stream stays clean.
+
+    Jobs can read and write any path the server's user can, so the socket
+    is created owner-only (0600) and there is deliberately no TCP mode.
+    """
+    import contextlib
+
+    def handle(lines, reply):
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                with contextlib.redirect_stdout(sys.stderr):
+                    result = run_job(line)
+            except Exception as e:
+                result = {'ok': False, 'error': str(e)}
+            reply(json.dumps(result) + '\n')
+
+    if address is None:
+        print("[*] Serving jobs on stdin (one per line, Ctrl+D to stop)", file=sys.stderr)
+
+        def reply(text):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+        try:
+            handle(sys.stdin, reply)
+        except KeyboardInterrupt:
+            pass
+        return True
+
+    import socketserver
+    import stat
+
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            lines = (raw.decode('utf-8', errors='ignore') for raw in self.rfile)
+            handle(lines, lambda text: self.wfile.write(text.encode('utf-8')))
+
+    # Unix sockets only: a TCP port would take jobs (and output paths) from any local user
+    if not hasattr(socketserver, 'UnixStreamServer'):
+        print("[!] ERROR: Unix sockets are not available here, serve on stdin instead")
+        return False
+
+    if os.path.lexists(address):
+        if not stat.S_ISSOCK(os.lstat(address).st_mode):
+            print(f"[!] ERROR: {address} exists and is not a socket")
+            return False
+        os.remove(address)
+
+    # Create the socket owner-only (0600) so other users cannot submit jobs
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(address, JobHandler)
+    finally:
+        os.umask(old_umask)
+
+    print(f"[*] Serving jobs on {address} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.lexists(address) and stat.S_ISSOCK(os.lstat(address).st_mode):
+            os.remove(address)
+    return True
+
+
+def benchmark_startup(runs=20):
+    """Time interpreter startup with and without importing the converter"""
+    import subprocess
+    import statistics
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    commands = {
+        'python (bare)': 'pass',
+        'import converter': f'import sys; sys.path.insert(0, {script_dir!r}); import {module}',
+    }
+
+    print("=" * 70)
+    print("  STARTUP BENCHMARK")
+    print("=" * 70)
+    print()
+    print(f"[*] {runs} runs each, {sys.executable}")
+
+    timings = {}
+    for label, code in commands.items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True)
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[label] = samples
+        print(f"[*] {label:<18} min {min(samples):6.1f} ms   median {statistics.median(samples):6.1f} ms")
+
+    overhead = min(timings['import converter']) - min(timings['python (bare)'])
+    print(f"[+] Import overhead: {overhead:.1f} ms")
+
+    # Which modules the import pulls in beyond a bare interpreter
+    probe = ("import sys; before = set(sys.modules); "
+             f"sys.path.insert(0, {script_dir!r}); import {module}; "
+             f"print(' '.join(sorted(set(sys.modules) - before - {{{module!r}}})))")
+    loaded = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True).stdout.split()
+    print(f"[*] Modules loaded at import: {', '.join(loaded) or 'none'}")
+    return True
+
+
 def main():
     if len(sys.argv) < 2:
         print("=" * 70)
         print("  UNIVERSAL WARDRIVING FILE CONVERTER")
         print("=" * 70)
         print()
-        print("Converts ANY wardriving format to CSV:")
+        print("Converts ANY wardriving format to CSV, GeoJSON, KML or MBTiles:")
         print("  • DStumbler, G-Mon, inSSIDer")
         print("  • Kismac, Kismet (all formats)")
         print("  • MacStumbler, NetStumbler")
@@ -710,16 +2084,35 @@ def main():
         print("Usage:")
         print("  Single file:")
         print("    python universal_wardrive_converter.py <input_file> [output.csv]")
+        print("    python universal_wardrive_converter.py <input_file> [output.geojson|.geojsonl|.kml|.mbtiles]")
         print()
         print("  Batch folder:")
         print("    python universal_wardrive_converter.py --folder <folder_path>")
         print("    python universal_wardrive_converter.py --folder <folder_path> --merge")
         print("    python universal_wardrive_converter.py --folder <folder_path> --recursive")
         print()
+        print("  Access point locations (one estimated position per BSSID):")
+        print("    python universal_wardrive_converter.py <input_file> --locate [output.csv]")
+        print("    python universal_wardrive_converter.py --folder <folder_path> --locate")
+        print()
+        print("  Long-running job server (avoids interpreter startup per file):")
+        print("    python universal_wardrive_converter.py --serve [--socket <path>]")
+        print()
+        print("  Live log (follow a file that is still being written):")
+        print("    python universal_wardrive_converter.py --follow <input_file> [output.csv]")
+        print()
         print("Options:")
         print("  --folder <path>    Convert all files in folder")
         print("  --merge           Combine all files into one master CSV")
         print("  --recursive       Scan subfolders too")
+        print("  --locate          Estimate AP locations from all observations per BSSID")
+        print("  --follow <file>   Keep converting new records as the log grows")
+        print("  --interval <sec>  Seconds between polls in follow mode (default 2)")
+        print("  --serve           Read jobs (\"input [output]\" or JSON) one per line")
+        print("  --socket <path>   Serve on a Unix socket (owner-only access)")
+        print("  --bench-startup   Measure interpreter and import startup time")
+        print("  --format <fmt>    Output format: csv, geojson, geojsonl, kml, mbtiles")
+        print("                    (default: from output extension, else csv)")
         print()
         print("Examples:")
         print("  python universal_wardrive_converter.py wigle_data.csv")
@@ -727,9 +2120,42 @@ def main():
         print("  python universal_wardrive_converter.py survey.kml output.csv")
         print("  python universal_wardrive_converter.py --folder ./wardrives")
         print("  python universal_wardrive_converter.py --folder ./data --merge --recursive")
+        print("  python universal_wardrive_converter.py --folder ./data --merge --format mbtiles")
+        print("  python universal_wardrive_converter.py --folder ./data --recursive --locate")
+        print("  python universal_wardrive_converter.py --follow live_wigle.csv live.csv")
         print()
         sys.exit(1)
 
+    # Check for server / benchmark modes
+    if '--serve' in sys.argv:
+        address = None
+        if '--socket' in sys.argv:
+            socket_idx = sys.argv.index('--socket')
+            if socket_idx + 1 >= len(sys.argv):
+                print("[!] ERROR: --socket requires a path")
+                sys.exit(1)
+            address = sys.argv[socket_idx + 1]
+        sys.exit(0 if serve(address) else 1)
+
+    if '--bench-startup' in sys.argv:
+        bench_idx = sys.argv.index('--bench-startup')
+        runs = 20
+        if bench_idx + 1 < len(sys.argv) and sys.argv[bench_idx + 1].isdigit():
+            runs = int(sys.argv[bench_idx + 1])
+        sys.exit(0 if benchmark_startup(runs) else 1)
+
+    output_format = None
+    if '--format' in sys.argv:
+        format_idx = sys.argv.index('--format')
+        if format_idx + 1 >= len(sys.argv):
+            print("[!] ERROR: --format requires a format name")
+            sys.exit(1)
+        output_format = sys.argv[format_idx + 1].lower()
+        if output_format != 'csv' and output_format not in OUTPUT_WRITERS:
+            print(f"[!] ERROR: Unknown output format: {output_format}")
+            print(f"    Supported: csv, {', '.join(OUTPUT_WRITERS)}")
+            sys.exit(1)
+
     # Check for folder mode
     if '--folder' in sys.argv:
         folder_idx = sys.argv.index('--folder')
@@ -742,15 +2168,60 @@ def main():
         recursive = '--recursive' in sys.argv
 
         converter = WardriveConverter()
-        success = converter.batch_convert_folder(folder_path, merge=merge, recursive=recursive)
+        if '--locate' in sys.argv:
+            output_folder = os.path.join(folder_path, 'converted')
+            os.makedirs(output_folder, exist_ok=True)
+            output_file = os.path.join(output_folder, 'ap_locations' + output_extension(output_format or 'csv'))
+            success = converter.locate([folder_path], output_file, recursive=recursive,
+                                       output_format=output_format)
+            sys.exit(0 if success else 1)
+
+        success = converter.batch_convert_folder(folder_path, merge=merge, recursive=recursive,
+                                                 output_format=output_format or 'csv')
+        sys.exit(0 if success else 1)
+
+    # Check for follow mode
+    if '--follow' in sys.argv:
+        follow_idx = sys.argv.index('--follow')
+        if follow_idx + 1 >= len(sys.argv):
+            print("[!] ERROR: --follow requires a file")
+            sys.exit(1)
+
+        input_file = sys.argv[follow_idx + 1]
+        output_file = None
+        if follow_idx + 2 < len(sys.argv) and not sys.argv[follow_idx + 2].startswith('--'):
+            output_file = sys.argv[follow_idx + 2]
+
+        interval = 2.0
+        if '--interval' in sys.argv:
+            interval_idx = sys.argv.index('--interval')
+            try:
+                interval = float(sys.argv[interval_idx + 1])
+            except (IndexError, ValueError):
+                print("[!] ERROR: --interval requires a number of seconds")
+                sys.exit(1)
+
+        converter = WardriveConverter()
+        success = converter.follow(input_file, output_file, interval=interval)
         sys.exit(0 if success else 1)
 
-    # Single file mode
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) >= 3 else None
+    # Single file mode (positional arguments, skipping option values)
+    args = [arg for i, arg in enumerate(sys.argv[1:], 1)
+            if not arg.startswith('--') and sys.argv[i - 1] != '--format']
+    if not args:
+        print("[!] ERROR: No input file given")
+        sys.exit(1)
+    input_file = args[0]
+    output_file = args[1] if len(args) >= 2 else None
 
     converter = WardriveConverter()
-    success = converter.convert(input_file, output_file)
+    if '--locate' in sys.argv:
+        if not output_file:
+            output_file = default_output_file(input_file, output_format, '_locations')
+        success = converter.locate([input_file], output_file, output_format=output_format)
+        sys.exit(0 if success else 1)
+
+    success = converter.convert(input_file, output_file, output_format)
 
     sys.exit(0 if success else 1)
 